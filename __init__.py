@@ -1,159 +1,221 @@
 import requests
-from PIL import Image
-import io
-import numpy as np
+from requests.adapters import HTTPAdapter
 import torch
 import os
 import configparser
 import time
 import base64
+import logging
 from enum import Enum
-from urllib.parse import urljoin
+
+log = logging.getLogger("flux_api")
+
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
 
 class Status(Enum):
     PENDING = "Pending"
     READY = "Ready"
     ERROR = "Error"
 
+# Parsed config files keyed by path, reused until the file's mtime changes
+_CFG_CACHE = {}
+
 class ConfigLoader:
     def __init__(self):
         current_dir = os.path.dirname(os.path.abspath(__file__))
         config_path = os.path.join(current_dir, "config.ini")
         
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(f"Config file not found at {config_path}. Please ensure config.ini exists in the same directory as the script.")
-            
+        try:
+            mtime = os.path.getmtime(config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found at {config_path}. Please ensure config.ini exists in the same directory as the script.") from None
+
+        cached = _CFG_CACHE.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            self.config = cached[1]
+            return
+
         self.config = configparser.ConfigParser()
         self.config.read(config_path)
+        _CFG_CACHE[config_path] = (mtime, self.config)
+
+# One pooled session shared by every node instance, so queued generations
+# reuse the same connections to api.bfl.ai and the sample CDN
+_SESSION = None
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
 
 class FluxPro11WithFinetune:
     RETURN_TYPES = ("IMAGE", "STRING")
     FUNCTION = "process"
     CATEGORY = "BFL"
 
+    _blank_image = None
+
+    _DISPATCH = {
+        "generate": "generate_image",
+        "finetune": "request_finetuning",
+        "inference": "finetune_inference"
+    }
+
+    _URLS = {
+        "ultra": "https://api.bfl.ai/v1/flux-pro-1.1-ultra",
+        "std": "https://api.bfl.ai/v1/flux-pro-1.1"
+    }
+
+    # Seconds to wait after each unsuccessful poll; the last value repeats
+    _POLL_DELAYS = (1, 2, 3, 5, 8, 10)
+
+    _RATIO_DIMS = {
+        "1:1":  (1024, 1024),
+        "4:3":  (1408, 1024),
+        "3:4":  (1024, 1408),
+        "16:9": (1408, 800),
+        "9:16": (800, 1408),
+        "21:9": (1408, 608),
+        "9:21": (608, 1408)
+    }
+
+    # Built once; ComfyUI queries INPUT_TYPES on every UI refresh.
+    # Choice lists stay lists because ComfyUI detects combo inputs by list type.
+    _INPUT_TYPES = {
+        "required": {
+            "mode": (["generate", "finetune", "inference"], {"default": "generate"}),
+            "prompt": ("STRING", {"default": "", "multiline": True}),
+            "ultra_mode": ("BOOLEAN", {"default": True}),
+            "aspect_ratio": ([
+                "21:9", "16:9", "4:3", "1:1", "3:4", "9:16", "9:21"
+            ], {"default": "16:9"}),
+            "safety_tolerance": ("INT", {"default": 6, "min": 0, "max": 6}),
+            "output_format": (["jpeg", "png"], {"default": "png"}),
+            "raw": ("BOOLEAN", {"default": False}),
+            "x_key": ("STRING", {"default": "", "multiline": False}),
+        },
+        "optional": {
+            "seed": ("INT", {"default": -1}),
+            "finetune_zip": ("STRING", {"default": "", "multiline": False}),
+            "finetune_comment": ("STRING", {"default": ""}),
+            "finetune_id": ("STRING", {"default": ""}),
+            "trigger_word": ("STRING", {"default": "TOK"}),
+            "finetune_mode": (["character", "product", "style", "general"], {"default": "general"}),
+            "iterations": ("INT", {"default": 300, "min": 100}),
+            "learning_rate": ("FLOAT", {"default": 0.00001, "min": 0.00001, "max": 0.0001, "step": 0.00001}),
+            "captioning": ("BOOLEAN", {"default": True}),
+            "priority": (["speed", "quality"], {"default": "quality"}),
+            "finetune_type": (["full", "lora"], {"default": "full"}),
+            "lora_rank": ("INT", {"default": 32}),
+            "finetune_strength": ("FLOAT", {"default": 1.2})
+        }
+    }
+
     def __init__(self):
         try:
             self.config_loader = ConfigLoader()
         except Exception as e:
-            print(f"[FLUX API] Initialization Error: {str(e)}")
-            print("[FLUX API] Please ensure config.ini is properly set up with API credentials")
+            log.error("[FLUX API] Initialization Error: %s", e)
+            log.error("[FLUX API] Please ensure config.ini is properly set up with API credentials")
             raise
 
+        self.session = _get_session()
+
     @classmethod
     def INPUT_TYPES(cls):
-        return {
-            "required": {
-                "mode": (["generate", "finetune", "inference"], {"default": "generate"}),
-                "prompt": ("STRING", {"default": "", "multiline": True}),
-                "ultra_mode": ("BOOLEAN", {"default": True}),
-                "aspect_ratio": ([
-                    "21:9", "16:9", "4:3", "1:1", "3:4", "9:16", "9:21"
-                ], {"default": "16:9"}),
-                "safety_tolerance": ("INT", {"default": 6, "min": 0, "max": 6}),
-                "output_format": (["jpeg", "png"], {"default": "png"}),
-                "raw": ("BOOLEAN", {"default": False}),
-                "x_key": ("STRING", {"default": "", "multiline": False}),
-            },
-            "optional": {
-                "seed": ("INT", {"default": -1}),
-                "finetune_zip": ("STRING", {"default": "", "multiline": False}),
-                "finetune_comment": ("STRING", {"default": ""}),
-                "finetune_id": ("STRING", {"default": ""}),
-                "trigger_word": ("STRING", {"default": "TOK"}),
-                "finetune_mode": (["character", "product", "style", "general"], {"default": "general"}),
-                "iterations": ("INT", {"default": 300, "min": 100}),
-                "learning_rate": ("FLOAT", {"default": 0.00001, "min": 0.00001, "max": 0.0001, "step": 0.00001}),
-                "captioning": ("BOOLEAN", {"default": True}),
-                "priority": (["speed", "quality"], {"default": "quality"}),
-                "finetune_type": (["full", "lora"], {"default": "full"}),
-                "lora_rank": ("INT", {"default": 32}),
-                "finetune_strength": ("FLOAT", {"default": 1.2})
-            }
-        }
+        return cls._INPUT_TYPES
 
     def process(self, mode, x_key, **kwargs):
         try:
-            print(f"[FLUX API] Processing in {mode} mode")
-            if mode == "generate":
-                img = self.generate_image(**kwargs, x_key=x_key)
-                return (*img, "")
-            elif mode == "finetune":
-                return self.request_finetuning(**kwargs, x_key=x_key)
-            elif mode == "inference":
-                return self.finetune_inference(**kwargs, x_key=x_key)
-            else:
-                print(f"[FLUX API] Error: Unknown mode {mode}")
+            log.info("[FLUX API] Processing in %s mode", mode)
+            fn_name = self._DISPATCH.get(mode)
+            if fn_name is None:
+                log.error("[FLUX API] Error: Unknown mode %s", mode)
                 return (*self.create_blank_image(), "")
+
+            result = getattr(self, fn_name)(x_key=x_key, **kwargs)
+            # generate_image returns only the image; the other modes already include the string output
+            return (*result, "") if mode == "generate" else result
         except Exception as e:
-            print(f"[FLUX API] Process Error: {str(e)}")
+            log.error("[FLUX API] Process Error: %s", e)
             return (*self.create_blank_image(), "")
 
     def generate_image(self, prompt, ultra_mode, aspect_ratio, 
                       safety_tolerance, output_format, raw, x_key, seed=-1, **kwargs):
         if not prompt:
-            print("[FLUX API] Error: Prompt cannot be empty")
+            log.error("[FLUX API] Error: Prompt cannot be empty")
             return self.create_blank_image()
 
         try:
+            common = {
+                "prompt": prompt,
+                "safety_tolerance": safety_tolerance,
+                "output_format": output_format
+            }
+            if seed != -1:
+                common["seed"] = seed
+
             if ultra_mode:
-                arguments = {
-                    "prompt": prompt,
-                    "aspect_ratio": aspect_ratio,
-                    "safety_tolerance": safety_tolerance,
-                    "output_format": output_format,
-                    "raw": raw
-                }
-                if seed != -1:
-                    arguments["seed"] = seed
-                    
-                url = "https://api.bfl.ai/v1/flux-pro-1.1-ultra"
+                arguments = {**common, "aspect_ratio": aspect_ratio, "raw": raw}
+                url = self._URLS["ultra"]
             else:
                 width, height = self.get_dimensions_from_ratio(aspect_ratio)
-                arguments = {
-                    "prompt": prompt,
-                    "width": width,
-                    "height": height,
-                    "safety_tolerance": safety_tolerance,
-                    "output_format": output_format
-                }
-                if seed != -1:
-                    arguments["seed"] = seed
-                    
-                url = "https://api.bfl.ai/v1/flux-pro-1.1"
+                arguments = {**common, "width": width, "height": height}
+                url = self._URLS["std"]
 
-            headers = {"x-key": x_key}
+            headers = {"x-key": x_key, "Content-Type": "application/json"}
             
-            print(f"[FLUX API] Sending request to: {url}")
-            print(f"[FLUX API] Arguments: {arguments}")
+            log.info("[FLUX API] Sending request to: %s", url)
+            log.debug("[FLUX API] Arguments: %s", arguments)
             
-            response = requests.post(url, json=arguments, headers=headers, timeout=30)
-            print(f"[FLUX API] Response Status: {response.status_code}")
+            response = self.session.post(url, data=_dumps(arguments), headers=headers, timeout=30)
+            log.debug("[FLUX API] Response Status: %s", response.status_code)
             
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = _loads(response.content)
                 if not response_data:
-                    print("[FLUX API] Error: Empty response received from server")
+                    log.error("[FLUX API] Error: Empty response received from server")
                     return self.create_blank_image()
                     
                 task_id = response_data.get("id")
                 if not task_id:
-                    print("[FLUX API] Error: No task ID received in response")
-                    print(f"[FLUX API] Response data: {response_data}")
+                    log.error("[FLUX API] Error: No task ID received in response")
+                    log.error("[FLUX API] Response data: %s", response_data)
                     return self.create_blank_image()
                     
-                print(f"[FLUX API] Task ID received: {task_id}")
+                log.info("[FLUX API] Task ID received: %s", task_id)
                 return self.get_result(task_id, output_format, x_key)
             else:
-                print(f"[FLUX API] Server Error: {response.status_code}")
-                print(f"[FLUX API] Response: {response.text}")
+                log.error("[FLUX API] Server Error: %s", response.status_code)
+                log.error("[FLUX API] Response: %s", response.text)
                 return self.create_blank_image()
                 
         except requests.exceptions.RequestException as e:
-            print(f"[FLUX API] Network Error: {str(e)}")
+            log.error("[FLUX API] Network Error: %s", e)
             return self.create_blank_image()
         except Exception as e:
-            print(f"[FLUX API] Unexpected Error: {str(e)}")
-            print(f"[FLUX API] Error Type: {type(e).__name__}")
+            log.error("[FLUX API] Unexpected Error: %s", e)
+            log.debug("[FLUX API] Error Type: %s", type(e).__name__)
             return self.create_blank_image()
 
     def request_finetuning(self, finetune_zip, finetune_comment, trigger_word="TOK",
@@ -161,18 +223,15 @@ class FluxPro11WithFinetune:
                           captioning=True, priority="quality", finetune_type="full", 
                           lora_rank=32, x_key='', **kwargs):
         try:
-            print("[FLUX API] Starting finetuning process")
+            log.info("[FLUX API] Starting finetuning process")
             if not finetune_comment:
-                print("[FLUX API] Error: finetune_comment is required")
+                log.error("[FLUX API] Error: finetune_comment is required")
                 return (*self.create_blank_image(), "")
 
             if not os.path.exists(finetune_zip):
-                print(f"[FLUX API] Error: ZIP file not found at {finetune_zip}")
+                log.error("[FLUX API] Error: ZIP file not found at %s", finetune_zip)
                 return (*self.create_blank_image(), "")
 
-            with open(finetune_zip, "rb") as file:
-                encoded_zip = base64.b64encode(file.read()).decode("utf-8")
-
             url = "https://api.bfl.ai/v1/finetune"
             headers = {
                 "Content-Type": "application/json",
@@ -182,7 +241,6 @@ class FluxPro11WithFinetune:
             payload = {
                 "finetune_comment": finetune_comment,
                 "trigger_word": trigger_word,
-                "file_data": encoded_zip,
                 "iterations": iterations,
                 "mode": finetune_mode,
                 "learning_rate": learning_rate,
@@ -192,27 +250,37 @@ class FluxPro11WithFinetune:
                 "finetune_type": finetune_type,
             }
 
-            print(f"[FLUX API] Sending finetuning request to {url}")
-            response = requests.post(url, headers=headers, json=payload)
-            print(f"[FLUX API] Response status: {response.status_code}")
-            print(f"[FLUX API] Response text: {response.text}")
+            # Splice the base64 archive into the JSON body as raw bytes so the large
+            # string never goes through the JSON encoder. Base64 needs no escaping,
+            # and the chunk size is a multiple of 3 so no padding lands mid-stream.
+            body = bytearray(_dumps(payload)[:-1])
+            body += b',"file_data":"'
+            with open(finetune_zip, "rb") as file:
+                while chunk := file.read(3 * 1024 * 1024):
+                    body += base64.b64encode(chunk)
+            body += b'"}'
+
+            log.info("[FLUX API] Sending finetuning request to %s", url)
+            response = self.session.post(url, headers=headers, data=body, timeout=60)
+            log.debug("[FLUX API] Response status: %s", response.status_code)
+            log.debug("[FLUX API] Response text: %s", response.text)
             
             response.raise_for_status()
-            result = response.json()
+            result = _loads(response.content)
             
             finetune_id = result.get("finetune_id", "")
-            print(f"[FLUX API] Finetuning initiated. ID: {finetune_id}")
+            log.info("[FLUX API] Finetuning initiated. ID: %s", finetune_id)
             return (*self.create_blank_image(), finetune_id)
 
         except Exception as e:
-            print(f"[FLUX API] Finetuning Error: {str(e)}")
-            print(f"[FLUX API] Error Type: {type(e).__name__}")
+            log.error("[FLUX API] Finetuning Error: %s", e)
+            log.debug("[FLUX API] Error Type: %s", type(e).__name__)
             return (*self.create_blank_image(), "")
 
     def finetune_inference(self, finetune_id, prompt, ultra_mode=True, 
                          finetune_strength=1.2, x_key='', **kwargs):
        try:
-           print(f"[FLUX API] Starting inference with finetune_id: {finetune_id}")
+           log.info("[FLUX API] Starting inference with finetune_id: %s", finetune_id)
            endpoint = "flux-pro-1.1-ultra-finetuned" if ultra_mode else "flux-pro-finetuned"
            url = f"https://api.bfl.ai/v1/{endpoint}"
            
@@ -228,111 +296,115 @@ class FluxPro11WithFinetune:
                **kwargs
            }
 
-           print(f"[FLUX API] Sending inference request to {url}")
-           print(f"[FLUX API] Payload: {payload}")
-           response = requests.post(url, headers=headers, json=payload)
-           print(f"[FLUX API] Response Status: {response.status_code}")
-           print(f"[FLUX API] Response Text: {response.text}")
+           log.info("[FLUX API] Sending inference request to %s", url)
+           log.debug("[FLUX API] Payload: %s", payload)
+           response = self.session.post(url, headers=headers, data=_dumps(payload), timeout=60)
+           log.debug("[FLUX API] Response Status: %s", response.status_code)
+           log.debug("[FLUX API] Response Text: %s", response.text)
            
            response.raise_for_status()
-           result = response.json()
+           result = _loads(response.content)
            
            task_id = result.get("id")
            if not task_id:
-               print("[FLUX API] Error: No task ID received for inference")
+               log.error("[FLUX API] Error: No task ID received for inference")
                return (*self.create_blank_image(), finetune_id)
                
-           print(f"[FLUX API] Inference task ID: {task_id}")
+           log.info("[FLUX API] Inference task ID: %s", task_id)
            return (*self.get_result(task_id, kwargs.get("output_format", "png"), x_key), finetune_id)
 
        except Exception as e:
-           print(f"[FLUX API] Inference Error: {str(e)}")
-           print(f"[FLUX API] Error Type: {type(e).__name__}")
+           log.error("[FLUX API] Inference Error: %s", e)
+           log.debug("[FLUX API] Error Type: %s", type(e).__name__)
            return (*self.create_blank_image(), finetune_id)
 
     def get_dimensions_from_ratio(self, aspect_ratio):
-        regular_dimensions = {
-            "1:1":  (1024, 1024),
-            "4:3":  (1408, 1024),
-            "3:4":  (1024, 1408),
-            "16:9": (1408, 800),
-            "9:16": (800, 1408),
-            "21:9": (1408, 608),
-            "9:21": (608, 1408)
-        }
-        return regular_dimensions.get(aspect_ratio, (1408, 800))
+        return self._RATIO_DIMS.get(aspect_ratio, (1408, 800))
 
     def create_blank_image(self):
-        blank_img = Image.new('RGB', (512, 512), color='black')
-        img_array = np.array(blank_img).astype(np.float32) / 255.0
-        img_tensor = torch.from_numpy(img_array)[None,]
-        return (img_tensor,)
+        # Every error path returns the same black frame, so build it once and share it
+        cls = type(self)
+        if cls._blank_image is None:
+            cls._blank_image = torch.zeros((1, 512, 512, 3), dtype=torch.float32)
+        return (cls._blank_image,)
 
-    def get_result(self, task_id, output_format, x_key, attempt=1, max_attempts=15):
-       if attempt > max_attempts:
-           print(f"[FLUX API] Max attempts reached for task_id {task_id}")
-           return self.create_blank_image()
+    def get_result(self, task_id, output_format, x_key, timeout=300):
+        get_url = f"https://api.bfl.ai/v1/get_result?id={task_id}"
+        headers = {"x-key": x_key}
 
-       try:
-           get_url = f"https://api.bfl.ai/v1/get_result?id={task_id}"
-           headers = {"x-key": x_key}
-           
-           wait_time = min(2 ** attempt + 5, 30)
-           print(f"[FLUX API] Waiting {wait_time} seconds before attempt {attempt}")
-           time.sleep(wait_time)
-           
-           print(f"[FLUX API] Attempt {attempt}: Checking result for task {task_id}")
-           response = requests.get(get_url, headers=headers, timeout=30)
-           print(f"[FLUX API] Response Status: {response.status_code}")
-           
-           if response.status_code == 200:
-               result = response.json()
-               status = result.get("status")
-               print(f"[FLUX API] Task Status: {status}")
-               
-               if status == Status.READY.value:
-                   sample_url = result.get('result', {}).get('sample')
-                   if not sample_url:
-                       print("[FLUX API] Error: No sample URL in response")
-                       print(f"[FLUX API] Response data: {result}")
-                       return self.create_blank_image()
-                       
-                   img_response = requests.get(sample_url, timeout=30)
-                   if img_response.status_code != 200:
-                       print(f"[FLUX API] Error downloading image: {img_response.status_code}")
-                       return self.create_blank_image()
-                   
-                   img = Image.open(io.BytesIO(img_response.content))
-                   
-                   with io.BytesIO() as output:
-                       img.save(output, format=output_format.upper())
-                       output.seek(0)
-                       img_converted = Image.open(output)
-                       img_array = np.array(img_converted).astype(np.float32) / 255.0
-                       print(f"[FLUX API] Successfully generated image for task {task_id}")
-                       return (torch.from_numpy(img_array)[None,],)
-                       
-               elif status == Status.PENDING.value:
-                   print(f"[FLUX API] Attempt {attempt}: Image not ready. Retrying...")
-                   return self.get_result(task_id, output_format, x_key, attempt + 1, max_attempts)
-               else:
-                   print(f"[FLUX API] Unexpected status: {status}")
-                   print(f"[FLUX API] Full response: {result}")
-                   return self.create_blank_image()
-                   
-           else:
-               print(f"[FLUX API] Error retrieving result: {response.status_code}")
-               print(f"[FLUX API] Response: {response.text}")
-               if attempt < max_attempts:
-                   return self.get_result(task_id, output_format, x_key, attempt + 1, max_attempts)
-               
-       except Exception as e:
-           print(f"[FLUX API] Error retrieving result: {str(e)}")
-           print(f"[FLUX API] Error Type: {type(e).__name__}")
-           if attempt < max_attempts:
-               return self.get_result(task_id, output_format, x_key, attempt + 1, max_attempts)
-               
-       return self.create_blank_image()
+        # Bound polling by elapsed time rather than attempt count, so the short early
+        # delays don't shrink the window that slow (queued/finetuned) jobs need
+        deadline = time.monotonic() + timeout
+        attempt = 1
+        while True:
+            try:
+                log.debug("[FLUX API] Attempt %s: Checking result for task %s", attempt, task_id)
+                response = self.session.get(get_url, headers=headers, timeout=30)
+                log.debug("[FLUX API] Response Status: %s", response.status_code)
+
+                if response.status_code == 200:
+                    result = _loads(response.content)
+                    status = result.get("status")
+                    log.debug("[FLUX API] Task Status: %s", status)
+
+                    if status == Status.READY.value:
+                        sample_url = result.get('result', {}).get('sample')
+                        if not sample_url:
+                            log.error("[FLUX API] Error: No sample URL in response")
+                            log.error("[FLUX API] Response data: %s", result)
+                            return self.create_blank_image()
+
+                        img_response = self.session.get(sample_url, timeout=30)
+                        if img_response.status_code != 200:
+                            log.error("[FLUX API] Error downloading image: %s", img_response.status_code)
+                            return self.create_blank_image()
+
+                        # Decoding deps are only needed once an image is ready; keep them off node import
+                        import io
+                        import numpy as np
+                        from PIL import Image
+
+                        # The sample is already delivered in output_format, decode it once
+                        img = Image.open(io.BytesIO(img_response.content))
+                        img.load()
+
+                        # Only pay for a conversion pass when the sample isn't plain RGB (e.g. RGBA PNG)
+                        if img.mode != "RGB":
+                            img = img.convert("RGB")
+
+                        # Hand torch the uint8 pixels and normalize there in one vectorized pass.
+                        # np.array (not asarray) keeps the buffer writable, which torch.from_numpy expects.
+                        pixels = torch.from_numpy(np.array(img, dtype=np.uint8))
+                        img_tensor = pixels.unsqueeze(0).to(torch.float32).div_(255.0)
+                        log.info("[FLUX API] Successfully generated image for task %s", task_id)
+                        return (img_tensor,)
+
+                    elif status == Status.PENDING.value:
+                        log.debug("[FLUX API] Attempt %s: Image not ready. Retrying...", attempt)
+                    else:
+                        log.error("[FLUX API] Unexpected status: %s", status)
+                        log.error("[FLUX API] Full response: %s", result)
+                        return self.create_blank_image()
+
+                else:
+                    log.warning("[FLUX API] Error retrieving result: %s", response.status_code)
+                    log.debug("[FLUX API] Response: %s", response.text)
+
+            except Exception as e:
+                log.warning("[FLUX API] Error retrieving result: %s", e)
+                log.debug("[FLUX API] Error Type: %s", type(e).__name__)
+
+            # Back off only between polls, so a result that is already ready costs no wait
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wait_time = min(self._POLL_DELAYS[min(attempt, len(self._POLL_DELAYS)) - 1], remaining)
+            log.debug("[FLUX API] Waiting %.1f seconds before attempt %s", wait_time, attempt + 1)
+            time.sleep(wait_time)
+            attempt += 1
+
+        log.error("[FLUX API] Timed out after %s seconds waiting for task_id %s", timeout, task_id)
+        return self.create_blank_image()
 
 NODE_CLASS_MAPPINGS = {
     "FluxPro11WithFinetune": FluxPro11WithFinetune